@@ -42,11 +42,14 @@ async def inspect_block_command(block_number: int, rpc: str):
 
     inspector = MEVInspector(rpc)
 
-    await inspector.inspect_single_block(
-        inspect_db_session=inspect_db_session,
-        trace_db_session=trace_db_session,
-        block=block_number,
-    )
+    try:
+        await inspector.inspect_single_block(
+            inspect_db_session=inspect_db_session,
+            trace_db_session=trace_db_session,
+            block=block_number,
+        )
+    finally:
+        await inspector.close()
 
 
 @cli.command()
@@ -57,10 +60,14 @@ async def fetch_block_command(block_number: int, rpc: str):
     trace_db_session = get_trace_session()
 
     inspector = MEVInspector(rpc)
-    block = await inspector.create_from_block(
-        block_number=block_number,
-        trace_db_session=trace_db_session,
-    )
+
+    try:
+        block = await inspector.create_from_block(
+            block_number=block_number,
+            trace_db_session=trace_db_session,
+        )
+    finally:
+        await inspector.close()
 
     print(block.json())
 
@@ -94,12 +101,16 @@ async def inspect_many_blocks_command(
         max_concurrency=max_concurrency,
         request_timeout=request_timeout,
     )
-    await inspector.inspect_many_blocks(
-        inspect_db_session=inspect_db_session,
-        trace_db_session=trace_db_session,
-        after_block=after_block,
-        before_block=before_block,
-    )
+
+    try:
+        await inspector.inspect_many_blocks(
+            inspect_db_session=inspect_db_session,
+            trace_db_session=trace_db_session,
+            after_block=after_block,
+            before_block=before_block,
+        )
+    finally:
+        await inspector.close()
 
 
 @cli.command()
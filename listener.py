@@ -55,15 +55,21 @@ async def run():
     inspector = MEVInspector(rpc)
     base_provider = get_base_provider(rpc)
 
-    while not killer.kill_now:
-        await inspect_next_block(
-            inspector,
-            inspect_db_session,
-            trace_db_session,
-            base_provider,
-            healthcheck_url,
-            export_actor,
-        )
+    try:
+        while not killer.kill_now:
+            await inspect_next_block(
+                inspector,
+                inspect_db_session,
+                trace_db_session,
+                base_provider,
+                healthcheck_url,
+                export_actor,
+            )
+    finally:
+        try:
+            await inspector.close()
+        finally:
+            await base_provider.close()
 
     logger.info("Stopping...")
 
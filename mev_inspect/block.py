@@ -182,7 +182,7 @@ def _find_base_fee_per_gas(
 
 def _get_miner_address_from_traces(traces: List[Trace]) -> Optional[str]:
     for trace in traces:
-        if trace.type == TraceType.reward:
+        if trace.type is TraceType.reward:
             return trace.action["author"]
 
     return None
@@ -192,7 +192,7 @@ def get_transaction_hashes(calls: List[Trace]) -> List[str]:
     result = []
 
     for call in calls:
-        if call.type != TraceType.reward:
+        if call.type is not TraceType.reward:
             if (
                 call.transaction_hash is not None
                 and call.transaction_hash not in result
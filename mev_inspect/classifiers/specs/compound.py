@@ -29,7 +29,6 @@ class CompoundLiquidationClassifier(LiquidationClassifier):
         debt_token_address = liquidation_trace.to_address
         received_token_address = liquidation_trace.inputs["cTokenCollateral"]
 
-        debt_purchase_amount = None
         received_amount = None
 
         debt_purchase_amount, debt_token_address = (
@@ -72,8 +71,6 @@ class CompoundLiquidationClassifier(LiquidationClassifier):
             error=liquidation_trace.error,
         )
 
-        return None
-
 
 COMPOUND_V2_CETH_SPEC = ClassifierSpec(
     abi_name="CEther",
@@ -236,6 +233,6 @@ COMPOUND_CLASSIFIER_SPECS: List[ClassifierSpec] = [
 def _get_seize_call(traces: List[ClassifiedTrace]) -> Optional[ClassifiedTrace]:
     """Find the call to `seize` in the child traces (successful liquidation)"""
     for trace in traces:
-        if trace.classification == Classification.seize:
+        if trace.classification is Classification.seize:
             return trace
     return None
@@ -1,8 +1,9 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from mev_inspect.abi import get_abi
 from mev_inspect.decode import ABIDecoder
 from mev_inspect.schemas.blocks import CallAction, CallResult
+from mev_inspect.schemas.classifiers import ClassifierSpec
 from mev_inspect.schemas.traces import (
     CallTrace,
     Classification,
@@ -29,6 +30,18 @@ class TraceClassifier:
             decoder = ABIDecoder(abi)
             self._decoders_by_abi_name[spec.abi_name] = decoder
 
+        self._specs_with_lower_valid_addresses: List[
+            Tuple[ClassifierSpec, Optional[Set[str]]]
+        ] = [
+            (
+                spec,
+                None
+                if spec.valid_contract_addresses is None
+                else {address.lower() for address in spec.valid_contract_addresses},
+            )
+            for spec in self._classifier_specs
+        ]
+
     def classify(
         self,
         traces: List[Trace],
@@ -36,11 +49,11 @@ class TraceClassifier:
         return [
             self._classify_trace(trace)
             for trace in traces
-            if trace.type != TraceType.reward
+            if trace.type is not TraceType.reward
         ]
 
     def _classify_trace(self, trace: Trace) -> ClassifiedTrace:
-        if trace.type == TraceType.call:
+        if trace.type is TraceType.call:
             classified_trace = self._classify_call(trace)
             if classified_trace is not None:
                 return classified_trace
@@ -55,14 +68,12 @@ class TraceClassifier:
         action = CallAction(**trace.action)
         result = CallResult(**trace.result) if trace.result is not None else None
 
-        for spec in self._classifier_specs:
-            if spec.valid_contract_addresses is not None:
-                lower_valid_addresses = {
-                    address.lower() for address in spec.valid_contract_addresses
-                }
-
-                if action.to not in lower_valid_addresses:
-                    continue
+        for spec, lower_valid_addresses in self._specs_with_lower_valid_addresses:
+            if (
+                lower_valid_addresses is not None
+                and action.to not in lower_valid_addresses
+            ):
+                continue
 
             decoder = self._decoders_by_abi_name[spec.abi_name]
             call_data = decoder.decode(action.input)
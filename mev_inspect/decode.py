@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, List, NamedTuple, Optional
 
 import eth_utils.abi
 from eth_abi import decode_abi
@@ -12,10 +12,27 @@ from mev_inspect.schemas.call_data import CallData
 SELECTOR_LENGTH = 10
 
 
+class _DecodableFunction(NamedTuple):
+    description: ABIFunctionDescription
+    signature: str
+    input_names: List[str]
+    input_types: List[str]
+
+
 class ABIDecoder:
     def __init__(self, abi: ABI):
-        self._functions_by_selector: Dict[str, ABIFunctionDescription] = {
-            description.get_selector(): description
+        self._functions_by_selector: Dict[str, _DecodableFunction] = {
+            description.get_selector(): _DecodableFunction(
+                description=description,
+                signature=description.get_signature(),
+                input_names=[input.name for input in description.inputs],
+                input_types=[
+                    input.type
+                    if input.type != "tuple"
+                    else eth_utils.abi.collapse_if_tuple(input.dict())
+                    for input in description.inputs
+                ],
+            )
             for description in abi
             if isinstance(description, ABIFunctionDescription)
         }
@@ -23,26 +40,18 @@ class ABIDecoder:
     def decode(self, data: str) -> Optional[CallData]:
         selector, params = data[:SELECTOR_LENGTH], data[SELECTOR_LENGTH:]
 
-        func = self._functions_by_selector.get(selector)
+        function = self._functions_by_selector.get(selector)
 
-        if func is None:
+        if function is None:
             return None
 
-        names = [input.name for input in func.inputs]
-        types = [
-            input.type
-            if input.type != "tuple"
-            else eth_utils.abi.collapse_if_tuple(input.dict())
-            for input in func.inputs
-        ]
-
         try:
-            decoded = decode_abi(types, hexstr_to_bytes(params))
+            decoded = decode_abi(function.input_types, hexstr_to_bytes(params))
         except (InsufficientDataBytes, NonEmptyPaddingBytes, OverflowError):
             return None
 
         return CallData(
-            function_name=func.name,
-            function_signature=func.get_signature(),
-            inputs={name: value for name, value in zip(names, decoded)},
+            function_name=function.description.name,
+            function_signature=function.signature,
+            inputs={name: value for name, value in zip(function.input_names, decoded)},
         )
@@ -30,12 +30,15 @@ class MEVInspector:
         max_concurrency: int = 1,
         request_timeout: int = 300,
     ):
-        base_provider = get_base_provider(rpc, request_timeout=request_timeout)
-        self.w3 = Web3(base_provider, modules={"eth": (AsyncEth,)}, middlewares=[])
+        self.base_provider = get_base_provider(rpc, request_timeout=request_timeout)
+        self.w3 = Web3(self.base_provider, modules={"eth": (AsyncEth,)}, middlewares=[])
 
         self.trace_classifier = TraceClassifier()
         self.max_concurrency = asyncio.Semaphore(max_concurrency)
 
+    async def close(self):
+        await self.base_provider.close()
+
     async def create_from_block(
         self,
         trace_db_session: Optional[orm.Session],
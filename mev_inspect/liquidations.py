@@ -5,44 +5,55 @@ from mev_inspect.schemas.classifiers import LiquidationClassifier
 from mev_inspect.schemas.liquidations import Liquidation
 from mev_inspect.schemas.traces import Classification, ClassifiedTrace, DecodedCallTrace
 from mev_inspect.schemas.transfers import Transfer
-from mev_inspect.traces import get_child_traces, is_child_trace_address
+from mev_inspect.traces import (
+    get_child_traces,
+    get_traces_by_transaction_hash,
+    is_child_trace_address,
+)
 from mev_inspect.transfers import get_child_transfers
 
 
 def has_liquidations(classified_traces: List[ClassifiedTrace]) -> bool:
-    liquidations_exist = False
-    for classified_trace in classified_traces:
-        if classified_trace.classification == Classification.liquidate:
-            liquidations_exist = True
-    return liquidations_exist
+    return any(
+        classified_trace.classification is Classification.liquidate
+        for classified_trace in classified_traces
+    )
 
 
 def get_liquidations(classified_traces: List[ClassifiedTrace]) -> List[Liquidation]:
 
+    liquidation_traces = [
+        trace
+        for trace in classified_traces
+        if isinstance(trace, DecodedCallTrace)
+        and trace.classification is Classification.liquidate
+    ]
+
+    if len(liquidation_traces) == 0:
+        return []
+
     liquidations: List[Liquidation] = []
     parent_liquidations: List[DecodedCallTrace] = []
+    traces_by_transaction_hash = get_traces_by_transaction_hash(classified_traces)
 
-    for trace in classified_traces:
-
-        if not isinstance(trace, DecodedCallTrace):
-            continue
+    for trace in liquidation_traces:
 
         if _is_child_liquidation(trace, parent_liquidations):
             continue
 
-        if trace.classification == Classification.liquidate:
-
-            parent_liquidations.append(trace)
-            child_traces = get_child_traces(
-                trace.transaction_hash, trace.trace_address, classified_traces
-            )
-            child_transfers = get_child_transfers(
-                trace.transaction_hash, trace.trace_address, child_traces
-            )
-            liquidation = _parse_liquidation(trace, child_traces, child_transfers)
-
-            if liquidation is not None:
-                liquidations.append(liquidation)
+        parent_liquidations.append(trace)
+        child_traces = get_child_traces(
+            trace.transaction_hash,
+            trace.trace_address,
+            traces_by_transaction_hash[trace.transaction_hash],
+        )
+        child_transfers = get_child_transfers(
+            trace.transaction_hash, trace.trace_address, child_traces
+        )
+        liquidation = _parse_liquidation(trace, child_traces, child_transfers)
+
+        if liquidation is not None:
+            liquidations.append(liquidation)
 
     return liquidations
 
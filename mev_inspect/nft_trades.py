@@ -32,7 +32,7 @@ def _get_nft_trades_for_transaction(
         if not isinstance(trace, DecodedCallTrace):
             continue
 
-        elif trace.classification == Classification.nft_trade:
+        elif trace.classification is Classification.nft_trade:
             child_transfers = get_child_transfers(
                 trace.transaction_hash,
                 trace.trace_address,
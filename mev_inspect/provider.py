@@ -1,9 +1,60 @@
-from web3 import AsyncHTTPProvider, Web3
+from typing import Any, Optional
+
+from aiohttp import ClientSession
+from web3 import AsyncHTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
 
 from mev_inspect.retry import http_retry_with_backoff_request_middleware
 
 
-def get_base_provider(rpc: str, request_timeout: int = 500) -> Web3.AsyncHTTPProvider:
-    base_provider = AsyncHTTPProvider(rpc, request_kwargs={"timeout": request_timeout})
+class SessionAsyncHTTPProvider(AsyncHTTPProvider):
+    """AsyncHTTPProvider that reuses one aiohttp session until closed
+
+    The stock provider opens a new session, and so a new connection, for every request.
+    Call close before the event loop that made the requests ends
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._session: Optional[ClientSession] = None
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        self.logger.debug(
+            "Making request HTTP. URI: %s, Method: %s", self.endpoint_uri, method
+        )
+        request_data = self.encode_rpc_request(method, params)
+
+        async with self._get_session().post(
+            self.endpoint_uri,
+            data=request_data,
+            **self.get_request_kwargs(),
+        ) as http_response:
+            raw_response = await http_response.read()
+
+        response = self.decode_rpc_response(raw_response)
+        self.logger.debug(
+            "Getting response HTTP. URI: %s, Method: %s, Response: %s",
+            self.endpoint_uri,
+            method,
+            response,
+        )
+        return response
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(raise_for_status=True)
+
+        return self._session
+
+
+def get_base_provider(rpc: str, request_timeout: int = 500) -> SessionAsyncHTTPProvider:
+    base_provider = SessionAsyncHTTPProvider(
+        rpc, request_kwargs={"timeout": request_timeout}
+    )
     base_provider.middlewares += (http_retry_with_backoff_request_middleware,)
     return base_provider
@@ -74,7 +74,7 @@ def _get_punk_bid_acceptances_for_transaction(
         if not isinstance(trace, DecodedCallTrace):
             continue
 
-        elif trace.classification == Classification.punk_accept_bid:
+        elif trace.classification is Classification.punk_accept_bid:
             punk_accept_bid = PunkBidAcceptance(
                 block_number=trace.block_number,
                 transaction_hash=trace.transaction_hash,
@@ -107,7 +107,7 @@ def _get_punk_bids_for_transaction(traces: List[ClassifiedTrace]) -> List[PunkBi
         if not isinstance(trace, DecodedCallTrace):
             continue
 
-        elif trace.classification == Classification.punk_bid:
+        elif trace.classification is Classification.punk_bid:
             punk_bid = PunkBid(
                 transaction_hash=trace.transaction_hash,
                 block_number=trace.block_number,
@@ -1,6 +1,9 @@
 import asyncio
 import logging
 from contextlib import contextmanager
+from typing import Optional
+
+from sqlalchemy import orm
 
 from mev_inspect.s3_export import export_block
 
@@ -23,7 +26,7 @@ def inspect_many_blocks_task(
     with _session_scope(DbMiddleware.get_inspect_sessionmaker()) as inspect_db_session:
         with _session_scope(DbMiddleware.get_trace_sessionmaker()) as trace_db_session:
             asyncio.run(
-                InspectorMiddleware.get_inspector().inspect_many_blocks(
+                _inspect_many_blocks(
                     inspect_db_session=inspect_db_session,
                     trace_db_session=trace_db_session,
                     after_block=after_block,
@@ -32,6 +35,25 @@ def inspect_many_blocks_task(
             )
 
 
+async def _inspect_many_blocks(
+    inspect_db_session: orm.Session,
+    trace_db_session: Optional[orm.Session],
+    after_block: int,
+    before_block: int,
+) -> None:
+    inspector = InspectorMiddleware.get_inspector()
+
+    try:
+        await inspector.inspect_many_blocks(
+            inspect_db_session=inspect_db_session,
+            trace_db_session=trace_db_session,
+            after_block=after_block,
+            before_block=before_block,
+        )
+    finally:
+        await inspector.close()
+
+
 def realtime_export_task(block_number: int):
     with _session_scope(DbMiddleware.get_inspect_sessionmaker()) as inspect_db_session:
         export_block(inspect_db_session, block_number)
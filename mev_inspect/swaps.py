@@ -32,12 +32,12 @@ def _get_swaps_for_transaction(traces: List[ClassifiedTrace]) -> List[Swap]:
         if not isinstance(trace, DecodedCallTrace):
             continue
 
-        elif trace.classification == Classification.transfer:
+        elif trace.classification is Classification.transfer:
             transfer = get_transfer(trace)
             if transfer is not None:
                 prior_transfers.append(transfer)
 
-        elif trace.classification == Classification.swap:
+        elif trace.classification is Classification.swap:
             child_transfers = get_child_transfers(
                 trace.transaction_hash,
                 trace.trace_address,
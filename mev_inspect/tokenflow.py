@@ -70,7 +70,7 @@ def get_tx_proxies(tx_traces: List[Trace], to_address: Optional[str]):
 
     for trace in tx_traces:
         if (
-            trace.type == TraceType.call
+            trace.type is TraceType.call
             and trace.action["callType"] == "delegatecall"
             and trace.action["from"] == to_address
         ):
@@ -93,7 +93,7 @@ def get_ether_flows(tx_traces, addresses_to_check):
     eth_outflow = 0
 
     for trace in tx_traces:
-        if trace.type == TraceType.call:
+        if trace.type is TraceType.call:
             value = int(
                 trace.action["value"], 16
             )  # converting from 0x prefix to decimal
@@ -140,7 +140,7 @@ def get_ether_flows(tx_traces, addresses_to_check):
                         elif transfer_from in addresses_to_check:
                             eth_outflow = eth_outflow + transfer_value
 
-        if trace.type == TraceType.suicide:
+        if trace.type is TraceType.suicide:
             if trace.action["refundAddress"] in addresses_to_check:
                 refund_value = int("0x" + trace.action["balance"], 16)
                 eth_inflow = eth_inflow + refund_value
@@ -152,7 +152,7 @@ def get_dollar_flows(tx_traces, addresses_to_check):
     dollar_inflow = 0
     dollar_outflow = 0
     for trace in tx_traces:
-        if trace.type == TraceType.call and is_stablecoin_address(trace.action["to"]):
+        if trace.type is TraceType.call and is_stablecoin_address(trace.action["to"]):
             _ = int(trace.action["value"], 16)  # converting from 0x prefix to decimal
 
             # USD_GET1 & USD_GET2 (to account for both 'transfer' and 'transferFrom' methods)
@@ -21,17 +21,16 @@ def get_child_traces(
     parent_trace_address: List[int],
     traces: List[ClassifiedTrace],
 ) -> List[ClassifiedTrace]:
-    ordered_traces = sorted(traces, key=lambda t: t.trace_address)
     child_traces = []
 
-    for trace in ordered_traces:
+    for trace in traces:
         if trace.transaction_hash == transaction_hash and is_child_trace_address(
             trace.trace_address,
             parent_trace_address,
         ):
             child_traces.append(trace)
 
-    return child_traces
+    return sorted(child_traces, key=lambda t: t.trace_address)
 
 
 def is_child_of_any_address(
@@ -39,10 +38,8 @@ def is_child_of_any_address(
 ) -> bool:
 
     return any(
-        [
-            is_child_trace_address(trace.trace_address, parent)
-            for parent in parent_trace_addresses
-        ]
+        is_child_trace_address(trace.trace_address, parent)
+        for parent in parent_trace_addresses
     )
 
 
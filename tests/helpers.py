@@ -77,7 +77,7 @@ def make_unknown_trace(
     transaction_hash: str,
     trace_address: List[int],
 ):
-    return ClassifiedTrace(
+    return ClassifiedTrace.construct(
         block_number=block_number,
         transaction_hash=transaction_hash,
         transaction_position=0,
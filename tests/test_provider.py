@@ -0,0 +1,54 @@
+import asyncio
+from typing import List
+
+import mev_inspect.provider
+from mev_inspect.provider import get_base_provider
+
+
+class FakeResponse:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def read(self) -> bytes:
+        return b'{"jsonrpc": "2.0", "id": 0, "result": "0x1"}'
+
+
+class FakeSession:
+    def __init__(self, sessions: List["FakeSession"]):
+        self.closed = False
+        self.request_count = 0
+        sessions.append(self)
+
+    def post(self, *args, **kwargs):
+        self.request_count += 1
+        return FakeResponse()
+
+    async def close(self):
+        self.closed = True
+
+
+def test_provider_reuses_session_until_closed(monkeypatch):
+    sessions: List[FakeSession] = []
+    monkeypatch.setattr(
+        mev_inspect.provider,
+        "ClientSession",
+        lambda **kwargs: FakeSession(sessions),
+    )
+
+    base_provider = get_base_provider("http://localhost:8545")
+
+    async def make_requests():
+        try:
+            await base_provider.make_request("eth_blockNumber", [])
+            await base_provider.make_request("eth_blockNumber", [])
+        finally:
+            await base_provider.close()
+
+    asyncio.run(make_requests())
+
+    assert len(sessions) == 1
+    assert sessions[0].request_count == 2
+    assert sessions[0].closed